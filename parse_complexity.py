@@ -1,78 +1,107 @@
 #!/usr/bin/env python3
 import argparse
+import bisect
+import collections
+import functools
 import json
+import mmap
+import operator
 import os
 import re
+import sys
 
 # --- Configuration for Parsing ---
+# The report is matched as bytes over an mmap of the analysis file; only the
+# complexipy section is decoded (its patterns use box-drawing characters).
 # Regex to find the target path being analyzed
-TARGET_PATH_RE = re.compile(r"Analyzing code complexity for: (.*)")
+TARGET_PATH_RE = re.compile(rb"Analyzing code complexity for: (.*)")
+
+# Section banner lines printed by analyze_python_code.sh
+SECTION_BANNER_RE = re.compile(rb"^={10,}\n(.+)\n={10,}\n", re.MULTILINE)
 
 # --- Radon Raw ---
-RADON_RAW_FILE_BLOCK_RE = re.compile(
-    r"^(.*?\.py)\n\s+LOC: (\d+)\n\s+LLOC: (\d+)\n\s+SLOC: (\d+)\n\s+Comments: (\d+)",
-    re.MULTILINE,
-)
-RADON_RAW_TOTAL_BLOCK_RE = re.compile(
-    r"\*\* Total \*\*\n\s+LOC: (\d+)\n\s+LLOC: (\d+)\n\s+SLOC: (\d+)\n\s+Comments: (\d+)",
+# Matches both per-file blocks and the ** Total ** block; 'path' is unset
+# for the total.
+RADON_RAW_COMBINED_RE = re.compile(
+    rb"^(?:(?P<path>[^\n]*?\.py)|\*\* Total \*\*)\n"
+    rb"\s+LOC: (?P<loc>\d+)\n\s+LLOC: (?P<lloc>\d+)\n\s+SLOC: (?P<sloc>\d+)\n\s+Comments: (?P<comments>\d+)",
     re.MULTILINE,
 )
 
 # --- Radon CC ---
-RADON_CC_FILE_RE = re.compile(r"^(.*?\.py)$", re.MULTILINE)
-RADON_CC_BLOCK_RE = re.compile(r"\s+([FMC])\s+[\d:]+\s+(.*?)\s+-\s+([A-F])\s+\((\d+)\)")
-RADON_CC_AVG_RE = re.compile(r"Average complexity:\s*([A-F])\s*\(([\d.]+)\)")
+# One alternation per line shape: file header, symbol block, or the average.
+RADON_CC_COMBINED_RE = re.compile(
+    rb"^(?P<file>\S.*?\.py)$"
+    rb"|^\s+(?P<kind>[FMC])\s+[\d:]+\s+(?P<name>[^-]+?)\s+-\s+(?P<rank>[A-F])\s+\((?P<score>\d+)\)"
+    rb"|Average complexity:\s*(?P<avg_rank>[A-F])\s*\((?P<avg_score>[\d.]+)\)",
+    re.MULTILINE,
+)
 
 # --- Radon MI ---
-RADON_MI_LINE_RE = re.compile(r"\s*(.*?\.py)\s+-\s+([A-F])\s+\(([\d.]+)\)")
+RADON_MI_LINE_RE = re.compile(rb"^\s*(\S+\.py)\s+-\s+([A-F])\s+\(([\d.]+)\)\s*$")
 
 # --- Flake8 Summary ---
 FLAKE8_SUMMARY_RE = re.compile(
-    r"\[WARNING\] Flake8 found (\d+) function\(s\) with CC > \d+\."
+    rb"\[WARNING\] Flake8 found (\d+) function\(s\) with CC > \d+\."
 )
 
 # --- Complexipy ---
+COMPLEXIPY_TABLE_BODY_RE = re.compile(r"(?:┡━+|│\s*Path\s*│).*?\n(.*?)\n\s*└─", re.DOTALL)
+COMPLEXIPY_HEADER_MARKER_RE = re.compile(r"(?:│\s*Path\s*│|┡━+)")
+# Rows are matched after ANSI color codes have been stripped from the section.
 COMPLEXIPY_ROW_RE = re.compile(
-    r"│\s*(.*?)\s*│\s*(.*?)\s*│\s*(.*?)\s*│\s*(?:\x1b\[\d+m)?(\d+)(?:\x1b\[0m)?\s*│"
+    r"^│\s*([^│]*?)\s*│\s*([^│]*?)\s*│\s*([^│]*?)\s*│\s*(\d+)\s*│"
 )
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 COMPLEXIPY_TOTAL_RE = re.compile(r"🧠 Total Cognitive Complexity: (\d+)")
 
+# Custom MI ranking: scores >= 85 are Excellent, >= 65 Good, >= 50 Moderate.
+_MI_THRESHOLDS = (50, 65, 85)
+_MI_RANKS = ("Difficult", "Moderate", "Good", "Excellent")
+
 
 def get_custom_mi_rank(mi_score):
     """Assigns a custom rank based on the MI score."""
-    if mi_score >= 85:
-        return "Excellent"
-    elif mi_score >= 65:
-        return "Good"
-    elif mi_score >= 50:
-        return "Moderate"
-    else:
-        return "Difficult"
+    # bisect_right keeps the thresholds inclusive (e.g. 85 -> Excellent).
+    return _MI_RANKS[bisect.bisect_right(_MI_THRESHOLDS, mi_score)]
+
+
+@functools.lru_cache(maxsize=4096)
+def get_normalized_path(path, base_path):
+    """Normalizes a path, making it absolute if base_path is provided and path is relative."""
+    norm_p = os.path.normpath(path)
+    if base_path and not os.path.isabs(norm_p):
+        if (
+            os.path.basename(base_path) == norm_p.split(os.sep)[0]
+            and len(norm_p.split(os.sep)) > 1
+        ):
+            return os.path.normpath(os.path.join(os.path.dirname(base_path), norm_p))
+        return os.path.normpath(os.path.join(base_path, norm_p))
+    return norm_p
 
 
 def parse_radon_raw_section(section_text):
-    """Parses Radon Raw metrics for files and totals."""
+    """Parses Radon Raw metrics for files and totals in a single scan."""
     file_metrics = []
-    for match in RADON_RAW_FILE_BLOCK_RE.finditer(section_text):
-        file_metrics.append(
-            {
-                "file_path": match.group(1).strip(),
-                "loc": int(match.group(2)),
-                "lloc": int(match.group(3)),
-                "sloc": int(match.group(4)),
-                "comments": int(match.group(5)),
-            }
-        )
-
     total_metrics = {}
-    total_match = RADON_RAW_TOTAL_BLOCK_RE.search(section_text)
-    if total_match:
-        total_metrics = {
-            "total_loc_radon": int(total_match.group(1)),
-            "total_lloc_radon": int(total_match.group(2)),
-            "total_sloc_radon": int(total_match.group(3)),
-            "total_comments_radon": int(total_match.group(4)),
-        }
+    for match in RADON_RAW_COMBINED_RE.finditer(section_text):
+        if match.group("path") is not None:
+            file_metrics.append(
+                {
+                    "file_path": match.group("path").strip().decode("utf-8"),
+                    "loc": int(match.group("loc")),
+                    "lloc": int(match.group("lloc")),
+                    "sloc": int(match.group("sloc")),
+                    "comments": int(match.group("comments")),
+                }
+            )
+        else:
+            total_metrics = {
+                "total_loc_radon": int(match.group("loc")),
+                "total_lloc_radon": int(match.group("lloc")),
+                "total_sloc_radon": int(match.group("sloc")),
+                "total_comments_radon": int(match.group("comments")),
+            }
     return {"files": file_metrics, "totals": total_metrics}
 
 
@@ -81,42 +110,39 @@ def parse_radon_cc_section(section_text):
     symbol_metrics = []
     current_file = None
     avg_cc = {}
-
-    for line in section_text.splitlines():
-        file_match = RADON_CC_FILE_RE.match(line)
-        if file_match:
-            current_file = file_match.group(1).strip()
-            continue
-
-        block_match = RADON_CC_BLOCK_RE.match(line)
-        if block_match and current_file:
-            symbol_type_map = {"F": "function", "M": "method", "C": "class"}
-            symbol_metrics.append(
-                {
-                    "file_path": current_file,
-                    "symbol_type": symbol_type_map.get(block_match.group(1), "unknown"),
-                    "symbol_name": block_match.group(2).strip(),
-                    "cc_rank": block_match.group(3),
-                    "cc_score": int(block_match.group(4)),
-                }
-            )
-
-        avg_match = RADON_CC_AVG_RE.search(line)
-        if avg_match:
+    symbol_type_map = {b"F": "function", b"M": "method", b"C": "class"}
+
+    for match in RADON_CC_COMBINED_RE.finditer(section_text):
+        if match.group("file") is not None:
+            current_file = match.group("file").strip().decode("utf-8")
+        elif match.group("kind") is not None:
+            if current_file:
+                symbol_metrics.append(
+                    {
+                        "file_path": current_file,
+                        "symbol_type": symbol_type_map.get(
+                            match.group("kind"), "unknown"
+                        ),
+                        "symbol_name": match.group("name").strip().decode("utf-8"),
+                        "cc_rank": match.group("rank").decode("utf-8"),
+                        "cc_score": int(match.group("score")),
+                    }
+                )
+        else:
             avg_cc = {
-                "average_cc_rank_radon": avg_match.group(1),
-                "average_cc_score": float(avg_match.group(2)),
+                "average_cc_rank_radon": match.group("avg_rank").decode("utf-8"),
+                "average_cc_score": float(match.group("avg_score")),
             }
 
     return {"symbols": symbol_metrics, "average": avg_cc}
 
 
-def parse_radon_mi_section(section_text):
+def parse_radon_mi_section(section_lines):
     """Parses Radon MI metrics for files by iterating lines and applies custom ranking."""
     file_metrics = []
-    for line_number, line in enumerate(section_text.splitlines()):
+    for line in section_lines:
         stripped_line = line.strip()
-        if not stripped_line or stripped_line.startswith("[INFO]"):
+        if not stripped_line or stripped_line.startswith(b"[INFO]"):
             continue
 
         match = RADON_MI_LINE_RE.match(stripped_line)
@@ -125,7 +151,7 @@ def parse_radon_mi_section(section_text):
             custom_rank = get_custom_mi_rank(mi_score)
             file_metrics.append(
                 {
-                    "file_path": match.group(1).strip(),
+                    "file_path": match.group(1).strip().decode("utf-8"),
                     "mi_score": mi_score,
                     "mi_rank_custom": custom_rank,  # Using custom rank
                 }
@@ -138,7 +164,7 @@ def parse_flake8_section(section_text):
     match = FLAKE8_SUMMARY_RE.search(section_text)
     if match:
         return {"flake8_high_cc_functions_count": int(match.group(1))}
-    if "Flake8 found 0 function(s)" in section_text:
+    if b"Flake8 found 0 function(s)" in section_text:
         return {"flake8_high_cc_functions_count": 0}
     return {"flake8_high_cc_functions_count": -1}
 
@@ -146,16 +172,18 @@ def parse_flake8_section(section_text):
 def parse_complexipy_section(section_text):
     """Parses Complexipy table output."""
     symbol_metrics = []
-    total_cognitive_complexity = 0
+    total_cognitive_complexity = None
 
-    table_content_match = re.search(
-        r"(?:┡━+|│\s*Path\s*│).*?\n(.*?)\n\s*└─", section_text, re.DOTALL
-    )
+    # Strip color codes up front so the row regex needs no optional
+    # escape-sequence groups around the score.
+    section_text = ANSI_RE.sub("", section_text)
+
+    table_content_match = COMPLEXIPY_TABLE_BODY_RE.search(section_text)
     actual_table_text = ""
     if table_content_match:
         actual_table_text = table_content_match.group(1)
     else:
-        header_marker_match = re.search(r"(?:│\s*Path\s*│|┡━+)", section_text)
+        header_marker_match = COMPLEXIPY_HEADER_MARKER_RE.search(section_text)
         if header_marker_match:
             actual_table_text = section_text[header_marker_match.end() :]
 
@@ -177,6 +205,7 @@ def parse_complexipy_section(section_text):
 
     return {
         "symbols": symbol_metrics,
+        # None when the total line is absent from the section.
         "total_cognitive_complexity": total_cognitive_complexity,
     }
 
@@ -187,7 +216,7 @@ def generate_file_tree(
     exclude_exts=None,
     prefix="",
 ):
-    """Generates a string representation of a file tree, ignoring most hidden dirs."""
+    """Yields the lines of a file tree, ignoring most hidden dirs."""
     if exclude_dirs_default is None:
         exclude_dirs_default = {
             "__pycache__",
@@ -200,59 +229,70 @@ def generate_file_tree(
     if exclude_exts is None:
         exclude_exts = {".pyc"}
 
-    tree_lines = []
-    try:
-        items = sorted(os.listdir(root_dir))
-    except FileNotFoundError:
-        tree_lines.append(f"{prefix}└── [Error: Directory not found: {root_dir}]")
-        return tree_lines
-    except PermissionError:
-        tree_lines.append(f"{prefix}└── [Error: Permission denied: {root_dir}]")
-        return tree_lines
-
-    for i, item_name in enumerate(items):
-        path = os.path.join(root_dir, item_name)
-        is_last = i == len(items) - 1
-        connector = "└── " if is_last else "├── "
-
-        if os.path.isdir(path):
-            # Ignore hidden directories, unless it's .vscode
-            if item_name.startswith(".") and item_name != ".vscode":
-                continue
-            # Always ignore default excluded dirs
-            if item_name in exclude_dirs_default:
-                continue
-
-            tree_lines.append(f"{prefix}{connector}{item_name}/")
-            new_prefix = prefix + ("    " if is_last else "│   ")
-            tree_lines.extend(
-                generate_file_tree(path, exclude_dirs_default, exclude_exts, new_prefix)
-            )
-        else:  # It's a file
-            # Hidden files are included unless their extension is excluded
-            if os.path.splitext(item_name)[1] in exclude_exts:
-                continue
-            tree_lines.append(f"{prefix}{connector}{item_name}")
-
-    return tree_lines
-
-
-def main(analysis_file_path):
-    """Main function to parse the analysis file and print results."""
-    try:
-        with open(analysis_file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except FileNotFoundError:
-        print(f"Error: Analysis file not found at '{analysis_file_path}'")
-        return
-    except Exception as e:
-        print(f"Error reading analysis file: {e}")
-        return
+    # Depth-first walk with an explicit stack; items are either finished
+    # lines to emit or (path, prefix) directories still to expand.
+    stack = [(root_dir, prefix)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+            continue
+
+        dir_path, dir_prefix = item
+        try:
+            # scandir caches the file type from the directory listing,
+            # avoiding a stat() per entry.
+            with os.scandir(dir_path) as entries_it:
+                entries = sorted(entries_it, key=lambda entry: entry.name)
+        except FileNotFoundError:
+            yield f"{dir_prefix}└── [Error: Directory not found: {dir_path}]"
+            continue
+        except PermissionError:
+            yield f"{dir_prefix}└── [Error: Permission denied: {dir_path}]"
+            continue
+
+        pending = []
+        for i, entry in enumerate(entries):
+            is_last = i == len(entries) - 1
+            connector = "└── " if is_last else "├── "
+
+            if entry.is_dir(follow_symlinks=False):
+                # Ignore hidden directories, unless it's .vscode
+                if entry.name.startswith(".") and entry.name != ".vscode":
+                    continue
+                # Always ignore default excluded dirs
+                if entry.name in exclude_dirs_default:
+                    continue
+
+                pending.append(f"{dir_prefix}{connector}{entry.name}/")
+                new_prefix = dir_prefix + ("    " if is_last else "│   ")
+                pending.append((entry.path, new_prefix))
+            else:  # It's a file
+                # Hidden files are included unless their extension is excluded
+                if os.path.splitext(entry.name)[1] in exclude_exts:
+                    continue
+                pending.append(f"{dir_prefix}{connector}{entry.name}")
+
+        stack.extend(reversed(pending))
+
+
+def main(analysis_file):
+    """Main function to parse the already-opened analysis file and print results."""
+    # argparse has opened the file for us; map it read-only instead of
+    # decoding it into one large str, then drop the descriptor (the mapping
+    # stays valid without it).
+    with analysis_file:
+        try:
+            content = mmap.mmap(analysis_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            content = b""
 
     target_path_match = TARGET_PATH_RE.search(content)
     project_root_path = None
     if target_path_match:
-        project_root_path = os.path.normpath(target_path_match.group(1).strip())
+        project_root_path = os.path.normpath(
+            target_path_match.group(1).strip().decode("utf-8")
+        )
         print(
             f"Project Root Path (for file tree and path normalization): {project_root_path}\n"
         )
@@ -266,45 +306,20 @@ def main(analysis_file_path):
         "file_level_metrics": [],
         "symbol_level_metrics": [],
     }
-    temp_file_metrics = {}
-    temp_symbol_metrics = {}
-
-    def get_normalized_path(path, base_path=project_root_path):
-        """Normalizes a path, making it absolute if base_path is provided and path is relative."""
-        norm_p = os.path.normpath(path)
-        if base_path and not os.path.isabs(norm_p):
-            if (
-                os.path.basename(base_path) == norm_p.split(os.sep)[0]
-                and len(norm_p.split(os.sep)) > 1
-            ):
-                return os.path.normpath(
-                    os.path.join(os.path.dirname(base_path), norm_p)
-                )
-            return os.path.normpath(os.path.join(base_path, norm_p))
-        return norm_p
+    # Keyed by normalized path (and symbol name); the identity fields are
+    # filled in from the keys when the final lists are built.
+    temp_file_metrics = collections.defaultdict(dict)
+    temp_symbol_metrics = collections.defaultdict(dict)
 
     def update_file_metric(path, data_dict):
-        norm_path = get_normalized_path(path)
-        if norm_path not in temp_file_metrics:
-            temp_file_metrics[norm_path] = {"file_path": norm_path}
+        norm_path = get_normalized_path(path, project_root_path)
         temp_file_metrics[norm_path].update(data_dict)
 
     def update_symbol_metric(path, symbol_name, data_dict):
-        norm_path = get_normalized_path(path)
-        key = (norm_path, symbol_name)
-        if key not in temp_symbol_metrics:
-            temp_symbol_metrics[key] = {
-                "file_path": norm_path,
-                "symbol_name": symbol_name,
-            }
-
-        current_data = temp_symbol_metrics[key]
+        norm_path = get_normalized_path(path, project_root_path)
+        current_data = temp_symbol_metrics[(norm_path, symbol_name)]
         for k, v in data_dict.items():
-            if (
-                k == "symbol_name_complexipy"
-                and "symbol_name" in current_data
-                and current_data["symbol_name"] != v
-            ):
+            if k == "symbol_name_complexipy" and v != symbol_name:
                 current_data["symbol_name_complexipy_alt"] = v
             elif (
                 k == "symbol_name"
@@ -315,139 +330,109 @@ def main(analysis_file_path):
             else:
                 current_data[k] = v
 
-    section_patterns = {
-        "radon_raw_files": r"={10,}\nRadon - Raw Metrics \(Source Lines of Code, Comments etc\.\)\n={10,}\n(?:\[INFO\].*?\n)?(.*?)(?=\n\*\* Total \*\*|\n={10,}|$)",
-        "radon_raw_total": r"(\*\* Total \*\*\n\s+LOC:.*?)(?:\n={10,}|$)",
-        "radon_cc": r"={10,}\nRadon - Cyclomatic Complexity \(CC\)\n={10,}\n(?:\[INFO\].*?\n)?(.*?Average complexity:.*?)(?:\n={10,}|$)",
-        "radon_mi": r"={10,}\nRadon - Maintainability Index \(MI\)\n={10,}\n(.*?)(?:\n={10,}|$)",
-        "flake8": r"={10,}\nFlake8 - Count of Functions with Cyclomatic Complexity > \d+\n={10,}\n(.*?)(?:\n={10,}|$)",
-        "complexipy": r"={10,}\nComplexipy - Cognitive Complexity\n={10,}\n(?:\[INFO\].*?\n){1,3}(.*?)(?:────────────────── 🎉 Analysis completed! 🎉 ──────────────────|\n={10,}|$)",
-    }
-
-    radon_raw_files_match = re.search(
-        section_patterns["radon_raw_files"], content, re.DOTALL | re.IGNORECASE
-    )
-    if radon_raw_files_match:
-        radon_raw_data_files = parse_radon_raw_section(radon_raw_files_match.group(1))
-        for fm in radon_raw_data_files.get("files", []):
-            update_file_metric(fm["file_path"], fm)
-
-    radon_raw_total_match = re.search(
-        section_patterns["radon_raw_total"], content, re.DOTALL | re.IGNORECASE
-    )
-    if radon_raw_total_match:
-        radon_raw_data_total = parse_radon_raw_section(radon_raw_total_match.group(1))
-        if radon_raw_data_total.get("totals"):
-            parsed_data["overall_summary"].update(radon_raw_data_total["totals"])
-    elif radon_raw_files_match and not parsed_data["overall_summary"].get(
-        "total_sloc_radon"
-    ):
-        radon_raw_data_full_fallback = parse_radon_raw_section(
-            radon_raw_files_match.group(1)
-        )
-        if radon_raw_data_full_fallback.get("totals"):
-            parsed_data["overall_summary"].update(
-                radon_raw_data_full_fallback["totals"]
-            )
-
-    radon_cc_match = re.search(section_patterns["radon_cc"], content, re.DOTALL)
-    if radon_cc_match:
-        radon_cc_data = parse_radon_cc_section(radon_cc_match.group(1))
-        for sm in radon_cc_data.get("symbols", []):
-            update_symbol_metric(sm["file_path"], sm["symbol_name"], sm)
-        if radon_cc_data.get("average"):
-            parsed_data["overall_summary"].update(radon_cc_data["average"])
-
-    radon_mi_match = re.search(section_patterns["radon_mi"], content, re.DOTALL)
-    if radon_mi_match:
-        radon_mi_data = parse_radon_mi_section(radon_mi_match.group(1))
-        for fm in radon_mi_data.get("files", []):
-            update_file_metric(fm["file_path"], fm)
-
-    flake8_match = re.search(section_patterns["flake8"], content, re.DOTALL)
-    if flake8_match:
-        parsed_data["overall_summary"].update(
-            parse_flake8_section(flake8_match.group(1))
-        )
-
-    complexipy_match = re.search(
-        section_patterns["complexipy"], content, re.DOTALL | re.IGNORECASE
-    )
-    if complexipy_match:
-        complexipy_section_content = complexipy_match.group(1)
+    # Split the report into sections in a single linear pass over the banner
+    # lines, then dispatch each section body by its header name.
+    banners = list(SECTION_BANNER_RE.finditer(content))
+    sections = []
+    for i, banner in enumerate(banners):
+        end = banners[i + 1].start() if i + 1 < len(banners) else len(content)
+        sections.append((banner.group(1), content[banner.end() : end]))
+
+    complexipy_section_content = None
+    for header, body in sections:
+        if header.startswith(b"Radon - Raw Metrics"):
+            radon_raw_data = parse_radon_raw_section(body)
+            for fm in radon_raw_data.get("files", []):
+                update_file_metric(fm["file_path"], fm)
+            if radon_raw_data.get("totals"):
+                parsed_data["overall_summary"].update(radon_raw_data["totals"])
+        elif header.startswith(b"Radon - Cyclomatic Complexity"):
+            radon_cc_data = parse_radon_cc_section(body)
+            for sm in radon_cc_data.get("symbols", []):
+                update_symbol_metric(sm["file_path"], sm["symbol_name"], sm)
+            if radon_cc_data.get("average"):
+                parsed_data["overall_summary"].update(radon_cc_data["average"])
+        elif header.startswith(b"Radon - Maintainability Index"):
+            radon_mi_data = parse_radon_mi_section(body.splitlines())
+            for fm in radon_mi_data.get("files", []):
+                update_file_metric(fm["file_path"], fm)
+        elif header.startswith(b"Flake8 - Count of Functions"):
+            parsed_data["overall_summary"].update(parse_flake8_section(body))
+        elif header.startswith(b"Complexipy - Cognitive Complexity"):
+            # The complexipy parser works on str for the box-drawing table.
+            complexipy_section_content = body.decode("utf-8")
+
+    if complexipy_section_content is not None:
         complexipy_data = parse_complexipy_section(complexipy_section_content)
+        # Index known symbols by (file basename, symbol name) so rows whose
+        # path does not match exactly resolve with one lookup instead of a
+        # scan over every known symbol.
+        basename_index = {
+            (os.path.basename(path), symbol): (path, symbol)
+            for (path, symbol) in temp_symbol_metrics
+        }
         for sm_complexipy in complexipy_data.get("symbols", []):
-            path_for_merging = get_normalized_path(sm_complexipy["complexipy_path"])
-            found_match = False
-            key_to_check = (path_for_merging, sm_complexipy["symbol_name_complexipy"])
-            if key_to_check in temp_symbol_metrics:
-                update_symbol_metric(
-                    path_for_merging,
-                    sm_complexipy["symbol_name_complexipy"],
-                    sm_complexipy,
-                )
-                found_match = True
-            else:
-                for (
-                    existing_path,
-                    existing_symbol,
-                ), data in temp_symbol_metrics.items():
-                    if (
-                        os.path.basename(existing_path)
-                        == sm_complexipy["file_name_complexipy"]
-                        and existing_symbol == sm_complexipy["symbol_name_complexipy"]
-                    ):
-                        update_symbol_metric(
-                            existing_path, existing_symbol, sm_complexipy
-                        )
-                        found_match = True
-                        break
-            if not found_match:
-                update_symbol_metric(
-                    path_for_merging,
-                    sm_complexipy["symbol_name_complexipy"],
-                    sm_complexipy,
+            path_for_merging = get_normalized_path(
+                sm_complexipy["complexipy_path"], project_root_path
+            )
+            symbol_name = sm_complexipy["symbol_name_complexipy"]
+            key = (path_for_merging, symbol_name)
+            if key not in temp_symbol_metrics:
+                key = basename_index.get(
+                    (sm_complexipy["file_name_complexipy"], symbol_name), key
                 )
-
-        if (
-            "total_cognitive_complexity" in complexipy_data
-            and complexipy_data["total_cognitive_complexity"] > 0
-        ):
+            if key not in temp_symbol_metrics:
+                # A new entry is about to be created; make it reachable by
+                # basename for the remaining rows, as the scan it replaces was.
+                basename_index[(os.path.basename(key[0]), key[1])] = key
+            update_symbol_metric(key[0], key[1], sm_complexipy)
+
+        total_cognitive_complexity = complexipy_data["total_cognitive_complexity"]
+        if total_cognitive_complexity is not None:
             parsed_data["overall_summary"]["total_cognitive_complexity"] = (
-                complexipy_data["total_cognitive_complexity"]
-            )
-        elif "total_cognitive_complexity" not in parsed_data["overall_summary"]:
-            overall_total_cg_match = COMPLEXIPY_TOTAL_RE.search(
-                complexipy_section_content
+                total_cognitive_complexity
             )
-            if overall_total_cg_match:
-                parsed_data["overall_summary"]["total_cognitive_complexity"] = int(
-                    overall_total_cg_match.group(1)
-                )
 
-    # Sort file_level_metrics by mi_score in ascending order
-    # Ensure 'mi_score' exists, provide a default (e.g., -1) for sorting if missing
+    # Sort file_level_metrics by mi_score in ascending order.
+    # Entries missing 'mi_score' get a -1 sentinel so the sort key can be a
+    # plain C-level itemgetter instead of a lambda with a .get fallback.
+    file_level_metrics = [
+        {"file_path": path, **data} for path, data in temp_file_metrics.items()
+    ]
+    for entry in file_level_metrics:
+        entry.setdefault("mi_score", -1)
     parsed_data["file_level_metrics"] = sorted(
-        list(temp_file_metrics.values()),
-        key=lambda x: x.get("mi_score", -1),
-        reverse=False,
+        file_level_metrics, key=operator.itemgetter("mi_score")
     )
 
-    # Sort symbol_level_metrics by cc_score in descending order
-    # Ensure 'cc_score' exists, provide a default (e.g., -1) for sorting if missing
+    # Sort symbol_level_metrics by cc_score in descending order, with the
+    # same -1 sentinel for entries that only have complexipy data.
+    symbol_level_metrics = [
+        {"file_path": path, "symbol_name": symbol, **data}
+        for (path, symbol), data in temp_symbol_metrics.items()
+    ]
+    for entry in symbol_level_metrics:
+        entry.setdefault("cc_score", -1)
     parsed_data["symbol_level_metrics"] = sorted(
-        list(temp_symbol_metrics.values()),
-        key=lambda x: x.get("cc_score", -1),
-        reverse=True,
+        symbol_level_metrics, key=operator.itemgetter("cc_score"), reverse=True
     )
 
+    # json.dump streams straight into stdout's buffer instead of building
+    # one large intermediate string per block.
     print("--- Parsed Data (List of Dicts) ---")
     print("\nOverall Summary:")
-    print(json.dumps(parsed_data["overall_summary"], indent=2, ensure_ascii=False))
+    json.dump(parsed_data["overall_summary"], sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
     print("\nFile Level Metrics (Sorted by MI Score Descending):")
-    print(json.dumps(parsed_data["file_level_metrics"], indent=2, ensure_ascii=False))
+    json.dump(
+        parsed_data["file_level_metrics"], sys.stdout, indent=2, ensure_ascii=False
+    )
+    sys.stdout.write("\n")
     print("\nSymbol Level Metrics (Sorted by CC Score Descending):")
-    print(json.dumps(parsed_data["symbol_level_metrics"], indent=2, ensure_ascii=False))
+    json.dump(
+        parsed_data["symbol_level_metrics"], sys.stdout, indent=2, ensure_ascii=False
+    )
+    sys.stdout.write("\n")
 
     if project_root_path and os.path.isdir(project_root_path):
         print("\n\n--- Project File Tree ---")
@@ -465,11 +450,10 @@ if __name__ == "__main__":
         description="Parse a code complexity analysis report."
     )
     parser.add_argument(
-        "analysis_file", help="Path to the analysis.txt file to process."
+        "analysis_file",
+        type=argparse.FileType("rb"),
+        help="Path to the analysis.txt file to process.",
     )
     args = parser.parse_args()
 
-    if not os.path.exists(args.analysis_file):
-        print(f"Error: The analysis file '{args.analysis_file}' was not found.")
-    else:
-        main(args.analysis_file)
+    main(args.analysis_file)